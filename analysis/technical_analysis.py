@@ -1,9 +1,77 @@
+import os
+import sys
+
 import pandas as pd
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+def _import_talib():
+    """Import the TA-Lib package, not the backtrader talib.py at the repo root
+
+    The root is first on sys.path under `streamlit run main.py`, where that
+    module would shadow the real package.
+    """
+    module = sys.modules.get('talib')
+    if module is not None and hasattr(module, 'RSI'):
+        return module
+    sys.modules.pop('talib', None)
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    saved_path = sys.path[:]
+    sys.path[:] = [path for path in sys.path if os.path.abspath(path or os.curdir) != root]
+    try:
+        import talib
+    finally:
+        sys.path[:] = saved_path
+    return talib
+
+try:
+    talib = _import_talib()
+except ImportError as e:
+    print(f"TA-Lib not available, using the numpy/numba indicators: {e}")
+    talib = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+from utils._njit import macd, rolling_max, rolling_min, wilder_rsi
+from utils._njit import rolling_std as welford_rolling_std
+
+FIB_RATIOS = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 1.0])
+FIB_COLUMNS = ['Fib_0', 'Fib_236', 'Fib_382', 'Fib_500', 'Fib_618', 'Fib_100']
+
+# Largest window view (rows * window) rolling_std reduces directly; beyond
+# that the std temporaries get big and the O(N) Welford kernel is used
+SWV_MAX_ELEMENTS = 1 << 22
+
+def rolling_mean(x, window):
+    """Trailing simple moving average computed as one uniform convolution"""
+    out = np.full(len(x), np.nan)
+    if window <= len(x):
+        out[window - 1:] = np.convolve(x, np.full(window, 1 / window), mode='valid')
+    return out
+
+def rolling_std(x, window):
+    """Trailing population std (ddof=0) reduced over a zero-copy window view"""
+    n = len(x)
+    if window > n or (n - window + 1) * window > SWV_MAX_ELEMENTS:
+        return welford_rolling_std(x, window)
+    out = np.full(n, np.nan)
+    out[window - 1:] = sliding_window_view(x, window).std(axis=1)
+    return out
 
 class TechnicalAnalyzer:
     def __init__(self, data):
         self.data = data
+        # Contiguous float64 copies made once and shared by every indicator
+        self._close = self._as_array('close')
+        self._high = self._as_array('high')
+        self._low = self._as_array('low')
+
+    def _as_array(self, column):
+        return np.ascontiguousarray(self.data[column].to_numpy(dtype=np.float64))
 
     def calculate_all_indicators(self):
         self.calculate_rsi()
@@ -13,36 +81,154 @@ class TechnicalAnalyzer:
         return self.data
 
     def calculate_rsi(self, period=14):
-        delta = self.data['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        self.data['RSI'] = 100 - (100 / (1 + rs))
+        if talib is not None:
+            self.data['RSI'] = talib.RSI(self._close, timeperiod=period)
+            return self.data
+
+        self.data['RSI'] = wilder_rsi(self._close, period)
         return self.data
 
     def calculate_macd(self, short_period=12, long_period=26, signal_period=9):
-        exp1 = self.data['close'].ewm(span=short_period, adjust=False).mean()
-        exp2 = self.data['close'].ewm(span=long_period, adjust=False).mean()
-        self.data['MACD'] = exp1 - exp2
-        self.data['Signal_Line'] = self.data['MACD'].ewm(span=signal_period, adjust=False).mean()
+        if talib is not None:
+            macd_line, signal, _ = talib.MACD(self._close, fastperiod=short_period,
+                                              slowperiod=long_period, signalperiod=signal_period)
+            self.data['MACD'] = macd_line
+            self.data['Signal_Line'] = signal
+            return self.data
+
+        macd_line, signal = macd(self._close, short_period, long_period, signal_period)
+        self.data['MACD'] = macd_line
+        self.data['Signal_Line'] = signal
         return self.data
 
     def calculate_bollinger_bands(self, period=20, std_dev=2):
-        self.data['BB_middle'] = self.data['close'].rolling(window=period).mean()
-        bb_std = self.data['close'].rolling(window=period).std()
-        self.data['BB_upper'] = self.data['BB_middle'] + (bb_std * std_dev)
-        self.data['BB_lower'] = self.data['BB_middle'] - (bb_std * std_dev)
+        if talib is not None:
+            upper, middle, lower = talib.BBANDS(self._close, timeperiod=period,
+                                                nbdevup=std_dev, nbdevdn=std_dev)
+            self.data['BB_middle'] = middle
+            self.data['BB_upper'] = upper
+            self.data['BB_lower'] = lower
+            return self.data
+
+        # Population std (ddof=0) to match TA-Lib's BBANDS
+        bb_middle = rolling_mean(self._close, period)
+        bb_std = rolling_std(self._close, period)
+        self.data['BB_middle'] = bb_middle
+        self.data['BB_upper'] = bb_middle + (bb_std * std_dev)
+        self.data['BB_lower'] = bb_middle - (bb_std * std_dev)
         return self.data
 
     def calculate_fibonacci_levels(self, period=14):
-        high_max = self.data['high'].rolling(window=period).max()
-        low_min = self.data['low'].rolling(window=period).min()
+        high_max = rolling_max(self._high, period)
+        low_min = rolling_min(self._low, period)
         diff = high_max - low_min
 
-        self.data['Fib_0'] = low_min
-        self.data['Fib_236'] = low_min + diff * 0.236
-        self.data['Fib_382'] = low_min + diff * 0.382
-        self.data['Fib_500'] = low_min + diff * 0.500
-        self.data['Fib_618'] = low_min + diff * 0.618
-        self.data['Fib_100'] = high_max
-        return self.data
\ No newline at end of file
+        # One (N, 6) block instead of six separate passes over diff/low_min
+        fib = low_min[:, None] + diff[:, None] * FIB_RATIOS[None, :]
+        fib[:, -1] = high_max
+        self.data[FIB_COLUMNS] = fib
+        return self.data
+
+
+def calculate_indicators_by_symbol(ohlcv_by_symbol):
+    """Calculate all indicators for several symbols in one (symbol, timestamp) indexed DataFrame"""
+    frames = {symbol: df for symbol, df in ohlcv_by_symbol.items() if not df.empty}
+    if not frames:
+        return pd.DataFrame()
+
+    return pd.concat(
+        {symbol: TechnicalAnalyzer(df.copy()).calculate_all_indicators() for symbol, df in frames.items()},
+        names=['symbol']
+    )
+
+
+def _seeded(expr, seed, start):
+    """expr from row start on, with row start replaced by seed and earlier rows null
+
+    Followed by ewm_mean(adjust=False) this gives TA-Lib's SMA-seeded averages.
+    """
+    row = pl.int_range(pl.len())
+    return (
+        pl.when(row < start).then(pl.lit(None, dtype=pl.Float64))
+        .when(row == start).then(seed)
+        .otherwise(expr)
+    )
+
+
+class TechnicalAnalyzerPolars:
+    """TechnicalAnalyzer variant that builds every indicator in one lazy Polars query"""
+
+    def __init__(self, data):
+        if pl is None:
+            raise ImportError("TechnicalAnalyzerPolars requires polars")
+        self.data = data
+
+    def calculate_all_indicators(self, rsi_period=14, short_period=12, long_period=26,
+                                 signal_period=9, bb_period=20, std_dev=2, fib_period=14):
+        index_name = self.data.index.name or 'index'
+        if long_period < short_period:
+            short_period, long_period = long_period, short_period
+        close = pl.col('close').cast(pl.Float64)
+        delta = close.diff()
+        gain = delta.clip(lower_bound=0.0)
+        loss = (-delta).clip(lower_bound=0.0)
+        macd_start = long_period - 1
+
+        # Stage 1: rolling/ewm building blocks, all read from the same input columns.
+        # Averages are seeded with an SMA like TA-Lib, see _seeded
+        base = [
+            _seeded(gain, gain.rolling_mean(window_size=rsi_period), rsi_period)
+            .ewm_mean(alpha=1 / rsi_period, adjust=False).alias('_gain'),
+            _seeded(loss, loss.rolling_mean(window_size=rsi_period), rsi_period)
+            .ewm_mean(alpha=1 / rsi_period, adjust=False).alias('_loss'),
+            _seeded(close, close.rolling_mean(window_size=short_period), macd_start)
+            .ewm_mean(span=short_period, adjust=False).alias('_ema_short'),
+            _seeded(close, close.rolling_mean(window_size=long_period), macd_start)
+            .ewm_mean(span=long_period, adjust=False).alias('_ema_long'),
+            close.rolling_mean(window_size=bb_period).alias('BB_middle'),
+            close.rolling_std(window_size=bb_period, ddof=0).alias('_bb_std'),
+            pl.col('high').cast(pl.Float64).rolling_max(window_size=fib_period).alias('_high_max'),
+            pl.col('low').cast(pl.Float64).rolling_min(window_size=fib_period).alias('_low_min'),
+        ]
+
+        # Stage 2: indicators derived from the building blocks
+        diff = pl.col('_high_max') - pl.col('_low_min')
+        derived = [
+            pl.when(pl.col('_gain') + pl.col('_loss') == 0).then(0.0)
+            .otherwise(100 * pl.col('_gain') / (pl.col('_gain') + pl.col('_loss'))).alias('RSI'),
+            (pl.col('_ema_short') - pl.col('_ema_long')).alias('MACD'),
+            (pl.col('BB_middle') + pl.col('_bb_std') * std_dev).alias('BB_upper'),
+            (pl.col('BB_middle') - pl.col('_bb_std') * std_dev).alias('BB_lower'),
+        ]
+        derived += [
+            (pl.col('_low_min') + diff * float(ratio)).alias(column)
+            for ratio, column in zip(FIB_RATIOS[:-1], FIB_COLUMNS[:-1])
+        ]
+        derived.append(pl.col('_high_max').alias(FIB_COLUMNS[-1]))
+
+        # Same column order as TechnicalAnalyzer.calculate_all_indicators
+        indicators = ['RSI', 'MACD', 'Signal_Line', 'BB_middle', 'BB_upper', 'BB_lower'] + FIB_COLUMNS
+        frame = self.data.reset_index()
+        inputs = [column for column in frame.columns if column not in indicators]
+
+        # Stage 3: signal line, with MACD hidden until it is defined like TA-Lib
+        macd_line = pl.col('MACD')
+        signal_start = macd_start + signal_period - 1
+
+        result = (
+            pl.from_pandas(frame)
+            .lazy()
+            .with_columns(base)
+            .with_columns(derived)
+            .with_columns(
+                _seeded(macd_line, macd_line.rolling_mean(window_size=signal_period), signal_start)
+                .ewm_mean(span=signal_period, adjust=False).alias('Signal_Line'),
+                _seeded(macd_line, macd_line, signal_start).alias('MACD')
+            )
+            .select(inputs + indicators)
+            .collect()
+        )
+        self.data = result.to_pandas().set_index(index_name)
+        if index_name == 'index':
+            self.data.index.name = None
+        return self.data
@@ -31,4 +31,10 @@ API_CONFIG = {
     'exchange': 'binance',
     'rate_limit': True,
     'rate_limit_wait': 1
+}
+
+# Cache configuration
+CACHE_CONFIG = {
+    'dir': 'cache',
+    'ttl': 300
 }
\ No newline at end of file
@@ -1,10 +1,14 @@
 import pandas as pd
 import numpy as np
 
+from utils._njit import rolling_max, rolling_min
+
 def calculate_support_resistance(data, window=20):
     """Calculate support and resistance levels"""
-    data['Support'] = data['low'].rolling(window=window).min()
-    data['Resistance'] = data['high'].rolling(window=window).max()
+    low = np.ascontiguousarray(data['low'].to_numpy(dtype=np.float64))
+    high = np.ascontiguousarray(data['high'].to_numpy(dtype=np.float64))
+    data['Support'] = rolling_min(low, window)
+    data['Resistance'] = rolling_max(high, window)
     return data
 
 def calculate_momentum(data, period=14):
@@ -15,19 +19,24 @@ def calculate_momentum(data, period=14):
 def calculate_volume_profile(data, bins=10):
     """Calculate volume profile"""
     price_range = np.linspace(data['low'].min(), data['high'].max(), bins)
-    volume_profile = []
-    
-    for i in range(len(price_range)-1):
-        mask = (data['close'] >= price_range[i]) & (data['close'] < price_range[i+1])
-        volume_profile.append(data.loc[mask, 'volume'].sum())
-    
-    return price_range, volume_profile
+
+    # Bucket every close in one pass; closes outside [edge_0, edge_-1) are
+    # dropped, matching the half-open intervals used per bin
+    idx = np.digitize(data['close'].to_numpy(), price_range) - 1
+    valid = (idx >= 0) & (idx < bins - 1)
+    volume = np.nan_to_num(data['volume'].to_numpy(dtype=np.float64)[valid])
+    volume_profile = np.bincount(idx[valid], weights=volume, minlength=bins - 1)
+
+    return price_range, volume_profile.tolist()
 
 def calculate_pivot_points(data):
     """Calculate pivot points"""
-    data['PP'] = (data['high'] + data['low'] + data['close']) / 3
-    data['R1'] = 2 * data['PP'] - data['low']
-    data['S1'] = 2 * data['PP'] - data['high']
-    data['R2'] = data['PP'] + (data['high'] - data['low'])
-    data['S2'] = data['PP'] - (data['high'] - data['low'])
-    return data
+    pp = (data['high'] + data['low'] + data['close']) / 3
+    hl = data['high'] - data['low']
+    return data.assign(
+        PP=pp,
+        R1=2 * pp - data['low'],
+        S1=2 * pp - data['high'],
+        R2=pp + hl,
+        S2=pp - hl
+    )
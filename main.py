@@ -1,6 +1,9 @@
 import os
+import importlib.util
+import plotly.io as pio
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -13,13 +16,22 @@ from indicators.custom_indicators import (
     calculate_volume_profile,
     calculate_pivot_points
 )
-from config.settings import TRADING_CONFIG, TA_PARAMS, BACKTEST_PARAMS
+from config.settings import TRADING_CONFIG, TA_PARAMS, BACKTEST_PARAMS, CACHE_CONFIG
 
 # Load environment variables
 load_dotenv("api.env")
 
+# orjson serializes numpy arrays much faster than plotly's default encoder
+if importlib.util.find_spec('orjson') is not None:
+    pio.json.config.default_engine = 'orjson'
+
+@st.cache_resource
+def get_data_fetcher():
+    """Share one DataFetcher across reruns"""
+    return DataFetcher()
+
 # Initialize DataFetcher
-data_fetcher = DataFetcher()
+data_fetcher = get_data_fetcher()
 
 def initialize_session_state():
     """Initialize session state variables"""
@@ -44,16 +56,35 @@ def get_available_symbols():
 @st.cache_data(ttl=300)
 def get_hot_cryptos(limit=5):
     """Get top cryptocurrencies by volume"""
-    symbols = data_fetcher.get_available_pairs()
+    symbols = get_available_symbols()
     # This is a simplified version. In reality, you'd want to sort by actual volume
     return symbols[:limit]
 
+@st.cache_data(ttl=CACHE_CONFIG['ttl'])
+def analyze_data(symbol, timeframe, bar_count, last_bar, _data):
+    """Run all indicators, memoized while the bars are unchanged
+
+    last_bar is the newest bar's timestamp followed by its OHLCV values.
+    """
+    # Perform technical analysis
+    analyzer = TechnicalAnalyzer(_data)
+    analyzed_data = analyzer.calculate_all_indicators()
+    
+    # Add additional indicators
+    analyzed_data = calculate_support_resistance(analyzed_data)
+    analyzed_data = calculate_momentum(analyzed_data)
+    analyzed_data = calculate_pivot_points(analyzed_data)
+
+    return analyzed_data
+
 def fetch_and_analyze_data(symbol):
     """Fetch and analyze cryptocurrency data"""
+    timeframe = TRADING_CONFIG['default_timeframe']
+
     # Fetch historical data
     data = data_fetcher.fetch_ohlcv(
         symbol,
-        timeframe=TRADING_CONFIG['default_timeframe'],
+        timeframe=timeframe,
         limit=TRADING_CONFIG['default_limit']
     )
     
@@ -61,16 +92,52 @@ def fetch_and_analyze_data(symbol):
         st.error(f"Failed to fetch data for {symbol}")
         return None
 
-    # Perform technical analysis
-    analyzer = TechnicalAnalyzer(data)
-    analyzed_data = analyzer.calculate_all_indicators()
-    
-    # Add additional indicators
-    analyzed_data = calculate_support_resistance(analyzed_data)
-    analyzed_data = calculate_momentum(analyzed_data)
-    analyzed_data = calculate_pivot_points(analyzed_data)
-    
-    return analyzed_data
+    # The newest candle is still forming, so its OHLCV values are part of
+    # the cache key and a price move invalidates the cached analysis
+    last_bar = (data.index[-1], *data.iloc[-1].tolist())
+    return analyze_data(symbol, timeframe, len(data), last_bar, data)
+
+SIGNAL_COLUMNS = ['RSI', 'MACD', 'Signal_Line', 'BB_lower', 'BB_upper', 'close']
+
+# Signal rules: weight, buy reason, sell reason
+SIGNAL_RULES = {
+    'RSI': (0.3, "RSI oversold", "RSI overbought"),
+    'MACD': (0.3, "MACD crossed above signal line", "MACD crossed below signal line"),
+    'BB': (0.2, "Price below lower Bollinger Band", "Price above upper Bollinger Band")
+}
+
+def _signal_conditions(data):
+    """Buy and sell conditions of every signal rule, evaluated over all bars"""
+    rsi = data['RSI'].to_numpy()
+    macd = data['MACD'].to_numpy()
+    signal_line = data['Signal_Line'].to_numpy()
+    close = data['close'].to_numpy()
+
+    return {
+        'RSI': [rsi < TA_PARAMS['rsi_oversold'], rsi > TA_PARAMS['rsi_overbought']],
+        'MACD': [macd > signal_line, macd < signal_line],
+        'BB': [close < data['BB_lower'].to_numpy(), close > data['BB_upper'].to_numpy()]
+    }
+
+def calculate_signal_scores(data, conditions=None):
+    """Score the RSI, MACD and Bollinger Band signals of every bar (positive = buy)"""
+    if conditions is None:
+        conditions = _signal_conditions(data)
+    scores = pd.DataFrame({
+        name: np.select(conditions[name], [weight, -weight], 0.0)
+        for name, (weight, _, _) in SIGNAL_RULES.items()
+    }, index=data.index)
+    scores['total'] = scores.sum(axis=1)
+    return scores
+
+def calculate_signal_reasons(data, conditions=None):
+    """Reason text of every bar's signals, '' where a rule did not fire"""
+    if conditions is None:
+        conditions = _signal_conditions(data)
+    return pd.DataFrame({
+        name: np.select(conditions[name], [buy_reason, sell_reason], '')
+        for name, (_, buy_reason, sell_reason) in SIGNAL_RULES.items()
+    }, index=data.index)
 
 def generate_trading_signals(data):
     """Generate trading signals based on technical indicators"""
@@ -79,38 +146,25 @@ def generate_trading_signals(data):
         'confidence': 0,
         'reasons': []
     }
+    last = data[SIGNAL_COLUMNS].iloc[-1:]
+    conditions = _signal_conditions(last)
+    score = calculate_signal_scores(last, conditions).iloc[0]
+    reasons = calculate_signal_reasons(last, conditions).iloc[0].to_dict()
 
-    # RSI Analysis
-    latest_rsi = data['RSI'].iloc[-1]
-    if latest_rsi < TA_PARAMS['rsi_oversold']:
-        signals['reasons'].append(f"RSI oversold ({latest_rsi:.2f})")
-        signals['confidence'] += 0.3
-        signals['action'] = 'BUY'
-    elif latest_rsi > TA_PARAMS['rsi_overbought']:
-        signals['reasons'].append(f"RSI overbought ({latest_rsi:.2f})")
-        signals['confidence'] += 0.3
-        signals['action'] = 'SELL'
+    # Formatting only happens here, for the bar being presented
+    if reasons['RSI']:
+        reasons['RSI'] += f" ({last['RSI'].iat[0]:.2f})"
+    signals['reasons'] = [reason for reason in reasons.values() if reason]
 
-    # MACD Analysis
-    if data['MACD'].iloc[-1] > data['Signal_Line'].iloc[-1]:
-        signals['reasons'].append("MACD crossed above signal line")
-        signals['confidence'] += 0.3
+    # Opposing signals cancel out, the net score decides the action
+    if score['total'] > 0:
         signals['action'] = 'BUY'
-    elif data['MACD'].iloc[-1] < data['Signal_Line'].iloc[-1]:
-        signals['reasons'].append("MACD crossed below signal line")
-        signals['confidence'] += 0.3
-        signals['action'] = 'SELL'
-
-    # Bollinger Bands Analysis
-    latest_close = data['close'].iloc[-1]
-    if latest_close < data['BB_lower'].iloc[-1]:
-        signals['reasons'].append("Price below lower Bollinger Band")
-        signals['confidence'] += 0.2
-        signals['action'] = 'BUY'
-    elif latest_close > data['BB_upper'].iloc[-1]:
-        signals['reasons'].append("Price above upper Bollinger Band")
-        signals['confidence'] += 0.2
+    elif score['total'] < 0:
         signals['action'] = 'SELL'
+    elif signals['reasons']:
+        # Rules fired but cancelled out; keep None for "nothing fired"
+        signals['action'] = 'HOLD'
+    signals['confidence'] = abs(score['total'])
 
     return signals
 
@@ -119,29 +173,31 @@ def plot_technical_analysis(data, symbol):
     import plotly.graph_objects as go
     from plotly.subplots import make_subplots
 
+    index = data.index.to_numpy()
+
     # Create figure with secondary y-axis
     fig = make_subplots(rows=2, cols=1, shared_xaxes=True,
                         vertical_spacing=0.03, row_heights=[0.7, 0.3])
 
     # Add candlestick chart
-    fig.add_trace(go.Candlestick(x=data.index,
-                                open=data['open'],
-                                high=data['high'],
-                                low=data['low'],
-                                close=data['close'],
+    fig.add_trace(go.Candlestick(x=index,
+                                open=data['open'].to_numpy(),
+                                high=data['high'].to_numpy(),
+                                low=data['low'].to_numpy(),
+                                close=data['close'].to_numpy(),
                                 name='OHLC'),
                   row=1, col=1)
 
     # Add Bollinger Bands
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_upper'],
+    fig.add_trace(go.Scatter(x=index, y=data['BB_upper'].to_numpy(),
                             name='Upper BB', line=dict(dash='dash')),
                   row=1, col=1)
-    fig.add_trace(go.Scatter(x=data.index, y=data['BB_lower'],
+    fig.add_trace(go.Scatter(x=index, y=data['BB_lower'].to_numpy(),
                             name='Lower BB', line=dict(dash='dash')),
                   row=1, col=1)
 
     # Add RSI
-    fig.add_trace(go.Scatter(x=data.index, y=data['RSI'],
+    fig.add_trace(go.Scatter(x=index, y=data['RSI'].to_numpy(),
                             name='RSI'),
                   row=2, col=1)
 
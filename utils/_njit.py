@@ -0,0 +1,142 @@
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit so the kernels still run as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def rolling_std(x, window):
+    """Rolling population std (ddof=0) using a sliding Welford update"""
+    n = len(x)
+    out = np.full(n, np.nan)
+    if window > n:
+        return out
+
+    mean = 0.0
+    m2 = 0.0
+    for i in range(window):
+        delta = x[i] - mean
+        mean += delta / (i + 1)
+        m2 += delta * (x[i] - mean)
+    out[window - 1] = np.sqrt(max(m2, 0.0) / window)
+
+    for i in range(window, n):
+        x_in = x[i]
+        x_out = x[i - window]
+        old_mean = mean
+        mean += (x_in - x_out) / window
+        m2 += (x_in - x_out) * (x_in - mean + x_out - old_mean)
+        out[i] = np.sqrt(max(m2, 0.0) / window)
+    return out
+
+
+@njit(cache=True)
+def rolling_min(x, window):
+    """Rolling minimum using a monotonic deque of indices"""
+    n = len(x)
+    out = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and x[deque[tail - 1]] >= x[i]:
+            tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = x[deque[head]]
+    return out
+
+
+@njit(cache=True)
+def rolling_max(x, window):
+    """Rolling maximum using a monotonic deque of indices"""
+    n = len(x)
+    out = np.full(n, np.nan)
+    deque = np.empty(n, dtype=np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        while tail > head and x[deque[tail - 1]] <= x[i]:
+            tail -= 1
+        deque[tail] = i
+        tail += 1
+        if deque[head] <= i - window:
+            head += 1
+        if i >= window - 1:
+            out[i] = x[deque[head]]
+    return out
+
+
+@njit(cache=True)
+def seeded_ema(x, period, start):
+    """EMA starting at index start, seeded with the SMA of the period values ending there"""
+    n = len(x)
+    out = np.full(n, np.nan)
+    if start >= n or start < period - 1:
+        return out
+
+    alpha = 2.0 / (period + 1)
+    prev = 0.0
+    for i in range(start - period + 1, start + 1):
+        prev += x[i]
+    prev /= period
+    out[start] = prev
+    for i in range(start + 1, n):
+        prev = alpha * x[i] + (1 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+@njit(cache=True)
+def macd(close, fast_period, slow_period, signal_period):
+    """MACD and signal line with TA-Lib's EMA seeding and slow + signal - 2 bar warm-up"""
+    if slow_period < fast_period:
+        fast_period, slow_period = slow_period, fast_period
+
+    # Both EMAs start at the first bar the slow one can, as in TA-Lib
+    start = slow_period - 1
+    macd_line = seeded_ema(close, fast_period, start) - seeded_ema(close, slow_period, start)
+    signal_start = start + signal_period - 1
+    signal = seeded_ema(macd_line, signal_period, signal_start)
+    macd_line[:min(signal_start, len(close))] = np.nan
+    return macd_line, signal
+
+
+@njit(cache=True)
+def wilder_rsi(close, period):
+    """RSI with Wilder smoothing, seeded with the SMA of the first period moves like TA-Lib"""
+    n = len(close)
+    out = np.full(n, np.nan)
+    if n <= period:
+        return out
+
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gain += delta
+        else:
+            loss -= delta
+    gain /= period
+    loss /= period
+    out[period] = 100.0 * gain / (gain + loss) if gain + loss != 0 else 0.0
+
+    for i in range(period + 1, n):
+        delta = close[i] - close[i - 1]
+        gain = (gain * (period - 1) + max(delta, 0.0)) / period
+        loss = (loss * (period - 1) + max(-delta, 0.0)) / period
+        out[i] = 100.0 * gain / (gain + loss) if gain + loss != 0 else 0.0
+    return out
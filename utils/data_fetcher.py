@@ -1,26 +1,83 @@
+import asyncio
+import json
+import os
 import ccxt
+import ccxt.async_support as ccxt_async
 import pandas as pd
 from datetime import datetime, timedelta
 
+from config.settings import API_CONFIG, CACHE_CONFIG
+
 class DataFetcher:
     def __init__(self, exchange_id='binance'):
+        self.exchange_id = exchange_id
         self.exchange = getattr(ccxt, exchange_id)()
 
+    def _to_dataframe(self, ohlcv):
+        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        df = df.astype({'open': 'float32', 'high': 'float32', 'low': 'float32',
+                        'close': 'float32', 'volume': 'float32'})
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        df.set_index('timestamp', inplace=True)
+        return df
+
     def fetch_ohlcv(self, symbol, timeframe='1d', limit=365):
         try:
             ohlcv = self.exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit)
-            df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
-            return df
+            return self._to_dataframe(ohlcv)
         except Exception as e:
             print(f"Error fetching data: {e}")
             return pd.DataFrame()
 
+    def fetch_ohlcv_many(self, symbols, timeframe='1d', limit=365):
+        """Fetch several symbols concurrently, returning {symbol: DataFrame}"""
+        return asyncio.run(self._fetch_ohlcv_many(symbols, timeframe, limit))
+
+    async def _fetch_ohlcv_many(self, symbols, timeframe, limit):
+        # The async client is bound to the running event loop, so it lives
+        # only for the duration of this call
+        exchange = getattr(ccxt_async, self.exchange_id)({'enableRateLimit': API_CONFIG['rate_limit']})
+        # Reuse the sync client's markets so the async one doesn't download them again
+        if self.exchange.markets:
+            exchange.set_markets(self.exchange.markets)
+        try:
+            results = await asyncio.gather(
+                *[exchange.fetch_ohlcv(symbol, timeframe=timeframe, limit=limit) for symbol in symbols],
+                return_exceptions=True
+            )
+        finally:
+            await exchange.close()
+
+        data = {}
+        for symbol, ohlcv in zip(symbols, results):
+            if isinstance(ohlcv, BaseException):
+                print(f"Error fetching data for {symbol}: {ohlcv}")
+                data[symbol] = pd.DataFrame()
+            else:
+                data[symbol] = self._to_dataframe(ohlcv)
+        return data
+
+    def _markets_path(self):
+        return os.path.join(CACHE_CONFIG['dir'], f"{self.exchange_id}_markets.json")
+
     def get_available_pairs(self):
+        # reload=True: the fetcher is shared across reruns, so refresh timing
+        # is left to the caller's cache TTL rather than ccxt's market cache
         try:
-            markets = self.exchange.load_markets()
-            return list(markets.keys())
+            markets = list(self.exchange.load_markets(reload=True).keys())
         except Exception as e:
             print(f"Error loading markets: {e}")
-            return []
\ No newline at end of file
+            # Fall back to the list saved by a previous session
+            try:
+                with open(self._markets_path()) as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return []
+
+        try:
+            os.makedirs(CACHE_CONFIG['dir'], exist_ok=True)
+            with open(self._markets_path(), 'w') as f:
+                json.dump(markets, f)
+        except OSError as e:
+            print(f"Error saving markets: {e}")
+        return markets
\ No newline at end of file